@@ -25,20 +25,51 @@ Implementation Notes
   https://circuitpython.org/downloads
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 * Adafruit's Register library: https://github.com/adafruit/Adafruit_CircuitPython_Register
+* Optional: ``ulab`` (CircuitPython) or ``numpy`` (Blinka) for :meth:`LIS331.acceleration_batch`
 """
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LIS331.git"
 
+__all__ = [
+    "LIS331",
+    "LIS331HH",
+    "H3LIS331",
+    "SampleRing",
+    "Rate",
+    "Mode",
+    "Frequency",
+    "RateDivisor",
+    "LIS331HHRange",
+    "H3LIS331Range",
+]
+
+from array import array
 from struct import unpack_from
+
+try:
+    from struct import Struct
+except ImportError:  # CircuitPython's struct module has no Struct class
+    Struct = None
 from time import sleep
-from adafruit_register.i2c_bits import RWBits
-from adafruit_register.i2c_bit import RWBit
+
+try:
+    from time import monotonic_ns
+except ImportError:  # boards without long integer support
+    monotonic_ns = None
 from adafruit_register.i2c_struct import UnaryStruct, ROUnaryStruct
 from adafruit_bus_device import i2c_device
 
 try:
-    from typing import Iterable, Optional, Tuple, Type, Union
+    import ulab.numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+try:
+    from typing import Iterable, Iterator, MutableSequence, Optional, Tuple, Union
     from busio import I2C
 except ImportError:
     pass
@@ -52,46 +83,26 @@ _LIS331_REG_CTRL3 = 0x22  # Interrupt config, poarity, pin mode, latching, pin e
 _LIS331_REG_CTRL4 = 0x23  # BDU, Endianness, Range, SPI mode
 _LIS331_REG_HP_FILTER_RESET = 0x25  # Dummy register to reset filter
 _LIS331_REG_REFERENCE = 0x26  # HPF reference value
+_LIS331_REG_STATUS = 0x27  # Data available and overrun flags
 _LIS331_REG_OUT_X_L = 0x28  # X-axis acceleration data. Low value */
 
-_G_TO_ACCEL = 9.80665
-
-
-class ROByteArray:
-    """
-    Array of registers that are readable only.
-
-    Based on the index, values are offset by the size of the structure.
-
-    Values are FixNums that map to the values in the defined struct.  See struct
-    module documentation for struct format string and its possible value types.
-
-    .. note::
-        This assumes the device addresses correspond to 8-bit bytes.
-        This is not suitable for devices with registers of other
-        widths such as 16-bit.
+_CTRL1_PM_MASK = 0xE0  # Power mode bits
+_CTRL1_DR_MASK = 0x18  # Data rate bits, or low-pass filter cutoff in low power modes
+_CTRL2_HPF_MASK = 0x33  # High-pass filter reference mode, enable and cutoff bits
+_CTRL4_FS_MASK = 0x30  # Full scale (range) bits
+_STATUS_ZYXDA = 0x08  # New data available on all three axes
 
-    :param int register_address: The register address to begin reading the array from
-    :param str format_str: The struct format string for this register.
-    :param int count: Number of elements in the array
-
-
-    """
-
-    def __init__(  # pylint: disable=too-many-arguments
-        self, register_address: int, format_str: str, count: int
-    ):
-        self.buffer = bytearray(1 + count)
-        self.buffer[0] = register_address
-        self.format = format_str
+_G_TO_ACCEL = 9.80665
 
-    def __get__(
-        self, obj: Optional["LIS331"], objtype: Optional[Type["LIS331"]] = None
-    ) -> int:
-        with obj.i2c_device as i2c:
-            i2c.write_then_readinto(self.buffer, self.buffer, out_end=1, in_start=1)
+if Struct is not None:
+    # pre-parse the X, Y, Z output format where `struct.Struct` is available
+    _unpack_acceleration = Struct("<hhh").unpack_from
+else:
 
-        return unpack_from(self.format, self.buffer, 1)  # offset=1
+    def _unpack_acceleration(
+        buffer: bytearray, offset: int = 0
+    ) -> Tuple[int, int, int]:
+        return unpack_from("<hhh", buffer, offset)
 
 
 class CV:
@@ -109,7 +120,8 @@ class CV:
             name, value, string, lsb = value_tuple
             setattr(cls, name, value)
             cls.string[value] = string
-            cls.lsb[value] = lsb
+            if lsb is not None:
+                cls.lsb[value] = lsb
 
     @classmethod
     def is_valid(cls, value: int) -> bool:
@@ -190,7 +202,7 @@ Frequency.add_values(
         ("FREQ_37_HZ", 0, 37, None),
         ("FREQ_74_HZ", 1, 74, None),
         ("FREQ_292_HZ", 2, 292, None),
-        ("FREQ_780_HZ", 4, 37, None),
+        ("FREQ_780_HZ", 3, 780, None),
     )
 )
 
@@ -209,6 +221,87 @@ RateDivisor.add_values(
 )
 
 
+class SampleRing:
+    """A fixed capacity ring buffer of raw acceleration samples, filled by
+    :meth:`LIS331.pump`. Once full, each new sample overwrites the oldest one, so a
+    consumer that stalls loses its oldest samples rather than the newest ones.
+
+    Each axis is stored in its own ``array("h")`` of raw values, `x`, `y` and `z`, so code
+    that only needs one axis can work through contiguous memory.
+
+    :param int capacity: The number of samples the ring can hold
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("SampleRing capacity must be at least 1")
+        self.capacity = capacity
+        self.x = array("h", [0] * capacity)
+        self.y = array("h", [0] * capacity)
+        self.z = array("h", [0] * capacity)
+        self._raw = bytearray(7)
+        self._head = 0  # the slot the next sample is written to
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push_read(self, i2c: i2c_device.I2CDevice, command: bytes) -> bool:
+        """Read the status register and the outputs in one transaction and, if the sensor
+        has a new sample, store it in the next slot, overwriting the oldest sample if the
+        ring is full.
+
+        :param ~adafruit_bus_device.i2c_device.I2CDevice i2c: An already entered device
+        :param bytes command: The auto-incrementing status register address
+        :return: `True` if a new sample was stored
+        """
+        raw = self._raw
+        i2c.write_then_readinto(command, raw)
+        if not raw[0] & _STATUS_ZYXDA:
+            return False
+        head = self._head
+        self.x[head], self.y[head], self.z[head] = _unpack_acceleration(raw, 1)
+        self._head = (head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+        return True
+
+    def pop(self) -> Tuple[int, int, int]:
+        """Remove the oldest sample and return its raw x, y, z values"""
+        if not self._count:
+            raise IndexError("pop from an empty SampleRing")
+        tail = (self._head - self._count) % self.capacity
+        self._count -= 1
+        return (self.x[tail], self.y[tail], self.z[tail])
+
+    def drain_into(
+        self, x: Optional[array], y: Optional[array], z: Optional[array]
+    ) -> int:
+        """Move the oldest samples into per-axis ``array("h")`` buffers, oldest first.
+
+        :param x: The buffer for the raw x values, or `None` to discard them
+        :param y: The buffer for the raw y values, or `None` to discard them
+        :param z: The buffer for the raw z values, or `None` to discard them
+        :return: The number of samples moved, limited by the shortest buffer given
+        """
+        count = self._count
+        for dest in (x, y, z):
+            if dest is not None:
+                count = min(count, len(dest))
+        tail = (self._head - self._count) % self.capacity
+        first = min(count, self.capacity - tail)  # samples before the end of the ring
+
+        for source, dest in ((self.x, x), (self.y, y), (self.z, z)):
+            if dest is not None:
+                source = memoryview(source)
+                dest = memoryview(dest)
+                dest[:first] = source[tail : tail + first]
+                dest[first:count] = source[: count - first]
+
+        self._count -= count
+        return count
+
+
 class LIS331:
     # pylint:disable=too-many-instance-attributes
     """Base class for the LIS331 family of 3-axis accelerometers.
@@ -219,31 +312,62 @@ class LIS331:
 
     """
 
-    _chip_id = ROUnaryStruct(_LIS331_REG_WHOAMI, "<B")
-    _mode_and_odr_bits = RWBits(5, _LIS331_REG_CTRL1, 3)
-    _power_mode_bits = RWBits(3, _LIS331_REG_CTRL1, 5)
-    _data_rate_lpf_bits = RWBits(2, _LIS331_REG_CTRL1, 3)
-    _range_bits = RWBits(2, _LIS331_REG_CTRL4, 4)
-    _raw_acceleration = ROByteArray((_LIS331_REG_OUT_X_L | 0x80), "<hhh", 6)
-
     _reference_value = UnaryStruct(_LIS331_REG_REFERENCE, "<b")
     _zero_hpf = ROUnaryStruct(_LIS331_REG_HP_FILTER_RESET, "<b")
-    _hpf_mode_bits = RWBit(_LIS331_REG_CTRL2, 5)
-    _hpf_enable_bit = RWBit(_LIS331_REG_CTRL2, 4)
-    _hpf_cutoff = RWBits(2, _LIS331_REG_CTRL2, 0)
+
+    # set by each subclass to the `CV` of ranges supported by that sensor
+    _range_class = None
 
     def __init__(self, i2c_bus: I2C, address: int = _LIS331_DEFAULT_ADDRESS) -> None:
-        if (not isinstance(self, LIS331HH)) and (not isinstance(self, H3LIS331)):
+        if self._range_class is None:
             raise RuntimeError(
                 "Base class LIS331 cannot be instantiated directly. Use LIS331HH or H3LIS331"
             )
         self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
-        if self._chip_id != _LIS331_CHIP_ID:
+        # setting the MSB of the register address auto-increments it, so all six
+        # output bytes are read in a single transaction
+        self._accel_cmd = bytes((_LIS331_REG_OUT_X_L | 0x80,))
+        # the status register comes right before the outputs, so both can be read at once
+        self._status_cmd = bytes((_LIS331_REG_STATUS | 0x80,))
+        self._accel_buffer = bytearray(6)
+        self._register_buffer = bytearray(2)
+        self._range_deadline = None
+        self._sample_period_ns = 0
+        self._last_read_ns = 0
+        self._last_acceleration = None
+        if self._read_register(_LIS331_REG_WHOAMI) != _LIS331_CHIP_ID:
             raise RuntimeError(
                 f"Failed to find {self.__class__.__name__} - check your wiring!"
             )
-        self._range_class = None
-        self.enable_hpf(False)
+        # CTRL1 to CTRL4 are only written by this driver, so keep copies to avoid
+        # read-modify-write cycles. They follow the auto-incrementing address of CTRL1
+        # so that all four can be written in a single burst
+        self._ctrl = bytearray((_LIS331_REG_CTRL1 | 0x80, 0, 0, 0, 0))
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._ctrl, self._ctrl, out_end=1, in_start=1)
+
+        # decode the configuration read back from the sensor, so the cached values agree
+        # with the copies above until a subclass sets its own with `_configure`
+        rate = self._ctrl[1] >> 3
+        self._cached_mode = self._mode_from_rate(rate)
+        if self._cached_mode != Mode.NORMAL:  # pylint: disable=no-member
+            rate &= 0x1C  # in the other modes the DR bits hold the low-pass cutoff
+        self._cached_data_rate = rate
+        self._lsb_scale = self._range_class.lsb[self.range] / 16
+
+    def _read_register(self, register: int) -> int:
+        buffer = self._register_buffer
+        buffer[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buffer, buffer, out_end=1, in_start=1)
+        return buffer[1]
+
+    def _write_register(self, register: int, value: int) -> None:
+        buffer = self._register_buffer
+        buffer[0] = register
+        buffer[1] = value
+        with self.i2c_device as i2c:
+            i2c.write(buffer)
 
     @property
     def lpf_cutoff(self) -> int:
@@ -252,7 +376,7 @@ class LIS331:
             raise RuntimeError(
                 "lpf_cuttoff cannot be read while a NORMAL data rate is in use"
             )
-        return self._data_rate_lpf_bits
+        return (self._ctrl[1] & _CTRL1_DR_MASK) >> 3
 
     @lpf_cutoff.setter
     def lpf_cutoff(self, cutoff_freq: int) -> None:
@@ -264,7 +388,8 @@ class LIS331:
                 "lpf_cuttoff cannot be set while a NORMAL data rate is in use"
             )
 
-        self._data_rate_lpf_bits = cutoff_freq
+        self._update_ctrl(_LIS331_REG_CTRL1, _CTRL1_DR_MASK, cutoff_freq << 3)
+        self._write_ctrl(_LIS331_REG_CTRL1)
 
     @property
     def hpf_reference(self) -> int:
@@ -294,6 +419,7 @@ class LIS331:
         if reference_value < -128 or reference_value > 127:
             raise AttributeError("`hpf_reference` must be from -128 to 127")
         self._reference_value = reference_value
+        self._last_acceleration = None
 
     def zero_hpf(self) -> None:
         """When the high-pass filter is enabled  with ``use_reference=False``,
@@ -302,6 +428,7 @@ class LIS331:
         without a :meth:`hpf_reference`
         """
         self._zero_hpf  # pylint: disable=pointless-statement
+        self._last_acceleration = None
 
     def enable_hpf(  # pylint: disable=no-member
         self,
@@ -325,9 +452,9 @@ class LIS331:
         translations/en.CD00215823.pdf>`_
 
         """
-        self._hpf_mode_bits = use_reference
-        self._hpf_cutoff = cutoff
-        self._hpf_enable_bit = enabled
+        hpf_bits = bool(use_reference) << 5 | bool(enabled) << 4 | cutoff
+        self._update_ctrl(_LIS331_REG_CTRL2, _CTRL2_HPF_MASK, hpf_bits)
+        self._write_ctrl(_LIS331_REG_CTRL2)
 
     @property
     def data_rate(self) -> float:
@@ -339,64 +466,238 @@ class LIS331:
         if not Rate.is_valid(new_rate_bits):
             raise AttributeError("data_rate must be a `Rate`")
 
+        self._set_data_rate(new_rate_bits)
+        self._write_ctrl(_LIS331_REG_CTRL1)
+
+    def _set_data_rate(self, new_rate_bits: int) -> None:
         # to determine what to be set we'll look at the mode to so we don't overwrite the filter
-        new_mode = self._mode_and_rate(new_rate_bits)[0]
+        new_mode = self._mode_from_rate(new_rate_bits)
         if new_mode == Mode.NORMAL:  # pylint: disable=no-member
-            self._mode_and_odr_bits = new_rate_bits
+            mask = _CTRL1_PM_MASK | _CTRL1_DR_MASK
         else:
-            self._power_mode_bits = new_mode
-
-        self._cached_data_rate = new_mode << 2 | new_rate_bits
+            mask = _CTRL1_PM_MASK
+        self._update_ctrl(_LIS331_REG_CTRL1, mask, new_rate_bits << 3)
+
+        self._cached_data_rate = new_rate_bits
+        self._cached_mode = new_mode
+
+        # at the low power rates, readings taken faster than the data rate would only
+        # repeat the last sample. The normal mode rates are too fast for the check to
+        # pay for the long ints that `monotonic_ns` allocates on CircuitPython
+        low_power = new_mode == Mode.LOW_POWER  # pylint: disable=no-member
+        if low_power and monotonic_ns is not None:
+            self._sample_period_ns = int(1000000000 / Rate.string[new_rate_bits])
+        else:
+            self._sample_period_ns = 0
+
+    def _update_ctrl(self, register: int, mask: int, value: int) -> None:
+        # update the masked bits of the cached copy of a CTRL register
+        index = register - _LIS331_REG_CTRL1 + 1
+        self._ctrl[index] = (self._ctrl[index] & ~mask) | (value & mask)
+        self._last_acceleration = None  # the configuration change affects new samples
+
+    def _write_ctrl(self, register: int) -> None:
+        self._write_register(register, self._ctrl[register - _LIS331_REG_CTRL1 + 1])
+
+    def _configure(self, data_rate: int, range_value: int) -> None:
+        # set the initial data rate and range with the high-pass filter disabled, writing
+        # CTRL1 to CTRL4 in a single burst and settling the range only once
+        self._set_data_rate(data_rate)
+        self._set_range(range_value)
+        self._update_ctrl(_LIS331_REG_CTRL2, _CTRL2_HPF_MASK, 0)
+        with self.i2c_device as i2c:
+            i2c.write(self._ctrl)
+        self._settle_range()
 
     @property
     def mode(self) -> int:
         """The :attr:`Mode` power mode that the sensor is set to, as determined by the current
         `data_rate`. To set the mode, use `data_rate` and the appropriate ``Rate``"""
-        mode_bits = self._mode_and_rate()[0]
-        return mode_bits
-
-    def _mode_and_rate(self, data_rate: Optional[int] = None) -> Tuple[int, int]:
-        if data_rate is None:
-            data_rate = self._cached_data_rate
+        return self._cached_mode
 
-        pm_value = (data_rate & 0x1C) >> 2
-        dr_value = data_rate & 0x3
-        if pm_value is Mode.LOW_POWER:  # pylint: disable=no-member
-            dr_value = 0
-        return (pm_value, dr_value)
+    @staticmethod
+    def _mode_from_rate(data_rate: int) -> int:
+        # the power mode bits of every low power rate are 2 or more
+        return min((data_rate & 0x1C) >> 2, Mode.LOW_POWER)  # pylint: disable=no-member
 
     @property
     def range(self) -> int:
         """Adjusts the range of values that the sensor can measure, Note that larger ranges will be
         less accurate. Must be a ``H3LIS331Range`` or ``LIS331HHRange``"""
-        return self._range_bits
+        return (self._ctrl[4] & _CTRL4_FS_MASK) >> 4
 
     @range.setter
     def range(self, new_range: int) -> None:
         if not self._range_class.is_valid(new_range):  # pylint: disable=no-member
             raise AttributeError(f"range must be a `{self._range_class.__qualname__}'")
-        self._range_bits = new_range
-        self._cached_accel_range = new_range
-        sleep(0.010)  # give time for the new rate to settle
+        self._set_range(new_range)
+        self._write_ctrl(_LIS331_REG_CTRL4)
+        self._settle_range()
+
+    def _set_range(self, new_range: int) -> None:
+        self._update_ctrl(_LIS331_REG_CTRL4, _CTRL4_FS_MASK, new_range << 4)
+        # The measurements are 12 bits left justified to preserve the sign bit, so
+        # fold the shift back to the real value into the scale factor
+        self._lsb_scale = self._range_class.lsb[new_range] / 16
+
+    def _settle_range(self) -> None:
+        # called once the new range has been written to the sensor
+        if monotonic_ns is None:
+            sleep(0.010)  # give time for the new range to settle
+        else:
+            # give the new range 10ms to settle before the next measurement, rather than
+            # blocking here when there may be other setup to do in the meantime
+            self._range_deadline = monotonic_ns() + 10000000
+
+    def _wait_for_range(self) -> None:
+        remaining = self._range_deadline - monotonic_ns()
+        if remaining > 0:
+            sleep(remaining / 1000000000)
+        self._range_deadline = None
+
+    def describe(self) -> str:
+        """A one line summary of the current `data_rate`, `range` and, in low power modes,
+        `lpf_cutoff`, built from the cached configuration without using the I2C bus."""
+        rate_hz = Rate.string[self._cached_data_rate]
+        range_g = self._range_class.string[self.range]
+        description = f"data_rate={rate_hz}Hz range=+/-{range_g}g"
+        if self._cached_mode == Mode.LOW_POWER:  # pylint: disable=no-member
+            description += f" lpf_cutoff={Frequency.string[self.lpf_cutoff]}Hz"
+        return description
 
     @property
     def acceleration(self) -> Tuple[int, int, int]:
-        """The x, y, z acceleration values returned in a 3-tuple and are in :math:`m / s ^ 2`."""
+        """The x, y, z acceleration values returned in a 3-tuple and are in :math:`m / s ^ 2`.
+        To avoid allocating a new tuple for every reading, pass a reusable 3 element buffer to
+        :meth:`acceleration_into` instead.
+
+        At the low power `data_rate` settings, reading more often than the data rate
+        returns the previous values without using the I2C bus, as the sensor will not have
+        a new sample yet. Boards without ``time.monotonic_ns`` always read the sensor."""
+        period = self._sample_period_ns
+        if period:
+            now = monotonic_ns()
+            if self._last_acceleration and now - self._last_read_ns < period:
+                return self._last_acceleration
+            self._last_read_ns = now
+        if self._range_deadline is not None:
+            self._wait_for_range()
+
+        raw = self._accel_buffer
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._accel_cmd, raw)
+        x, y, z = _unpack_acceleration(raw)
+
+        scale = self._lsb_scale
+        self._last_acceleration = (x * scale, y * scale, z * scale)
+        return self._last_acceleration
+
+    def acceleration_into(self, buffer: MutableSequence[float]) -> int:
+        """Read consecutive acceleration samples into ``buffer``, holding the I2C bus for the
+        whole batch. Each sample is stored as three x, y, z values in :math:`m / s ^ 2`, so
+        ``len(buffer) // 3`` samples are read.
+
+        Samples are read back to back without waiting for new data, so the number of
+        distinct samples depends on the bus speed and `data_rate`.
+
+        :param buffer: A preallocated, writable sequence of floats such as
+         ``array.array("f", [0.0] * 3 * count)``. Reusing it avoids allocating a tuple
+         for every sample.
+        :return: The number of samples read
+        """
+        if self._range_deadline is not None:
+            self._wait_for_range()
+
+        cmd = self._accel_cmd
+        raw = self._accel_buffer
+        scale = self._lsb_scale
+        end = len(buffer) - len(buffer) % 3
+
+        with self.i2c_device as i2c:
+            for i in range(0, end, 3):
+                i2c.write_then_readinto(cmd, raw)
+                x, y, z = _unpack_acceleration(raw)
+                buffer[i] = x * scale
+                buffer[i + 1] = y * scale
+                buffer[i + 2] = z * scale
+
+        return end // 3
+
+    def acceleration_batch(self, count: int) -> "np.ndarray":
+        """Read ``count`` consecutive acceleration samples while holding the I2C bus and
+        scale them all in a single array operation. Requires ``ulab`` or ``numpy``.
+
+        :param int count: The number of samples to read
+        :return: A ``count`` by 3 array of x, y, z values in :math:`m / s ^ 2`
+        """
+        if np is None:
+            raise RuntimeError("acceleration_batch requires ulab or numpy")
 
-        raw_acceleration_bytes = self._raw_acceleration
+        # the output registers are little endian, as are all supported platforms
+        samples = np.frombuffer(self.read_burst(count), dtype=np.int16)
+        return samples.reshape((count, 3)) * self._lsb_scale
 
-        return (
-            self._scale_acceleration(raw_acceleration_bytes[0]),
-            self._scale_acceleration(raw_acceleration_bytes[1]),
-            self._scale_acceleration(raw_acceleration_bytes[2]),
-        )
+    def acceleration_burst(self, count: int) -> array:
+        """Read ``count`` consecutive samples while holding the I2C bus and unpack them all
+        at once, without ``ulab`` or ``numpy``. The values are the raw x, y, z outputs
+        left justified in signed 16-bit words; divide by 16 and multiply by the `range`'s
+        ``lsb`` to convert them to :math:`g`.
 
-    def _scale_acceleration(self, value: int) -> int:
-        # The measurements are 12 bits left justified to preserve the sign bit
-        # so we'll shift them back to get the real value
-        right_justified = value >> 4
-        lsb_value = self._range_class.lsb[self._cached_accel_range]
-        return right_justified * lsb_value
+        :param int count: The number of samples to read
+        :return: An ``array('h')`` of ``3 * count`` interleaved x, y, z values
+        """
+        # the output registers are little endian, as are all supported platforms
+        return array("h", self.read_burst(count))
+
+    def pump(self, ring: SampleRing) -> bool:
+        """Add the sensor's latest sample to ``ring`` if it has not been read yet. Call this
+        from the main loop at least as often as the `data_rate`, since samples the sensor
+        replaces before they are pumped are lost, and consume them in batches with
+        :meth:`acceleration_stream` or :meth:`SampleRing.drain_into`.
+
+        :param SampleRing ring: The ring to add the sample to
+        :return: `True` if a new sample was added
+        """
+        if self._range_deadline is not None:
+            self._wait_for_range()
+
+        with self.i2c_device as i2c:
+            return ring.push_read(i2c, self._status_cmd)
+
+    def acceleration_stream(
+        self, ring: SampleRing
+    ) -> Iterator[Tuple[float, float, float]]:
+        """Remove the samples in ``ring``, oldest first, yielding each as an x, y, z tuple in
+        :math:`m / s ^ 2` scaled with the current `range`.
+
+        :param SampleRing ring: A ring filled by :meth:`pump`
+        """
+        scale = self._lsb_scale
+        while ring:
+            x, y, z = ring.pop()
+            yield (x * scale, y * scale, z * scale)
+
+    def read_burst(self, count: int, buffer: Optional[bytearray] = None) -> bytearray:
+        """Read ``count`` consecutive raw samples back to back while holding the I2C bus.
+        Each sample is six bytes holding the little endian x, y and z outputs as 12-bit
+        values left justified in signed 16-bit words, unscaled.
+
+        :param int count: The number of samples to read
+        :param bytearray buffer: An optional preallocated buffer of at least ``6 * count``
+         bytes to read into, so it can be reused between bursts
+        :return: The buffer the samples were read into
+        """
+        if buffer is None:
+            buffer = bytearray(6 * count)
+        if self._range_deadline is not None:
+            self._wait_for_range()
+
+        cmd = self._accel_cmd
+        with self.i2c_device as i2c:
+            for start in range(0, 6 * count, 6):
+                i2c.write_then_readinto(cmd, buffer, in_start=start, in_end=start + 6)
+
+        return buffer
 
 
 class LIS331HH(LIS331):
@@ -430,12 +731,12 @@ class LIS331HH(LIS331):
 
     """
 
+    _range_class = LIS331HHRange
+
     def __init__(self, i2c_bus: I2C, address: int = _LIS331_DEFAULT_ADDRESS) -> None:
         # pylint: disable=no-member
         super().__init__(i2c_bus, address)
-        self._range_class = LIS331HHRange
-        self.data_rate = Rate.RATE_1000_HZ
-        self.range = LIS331HHRange.RANGE_24G
+        self._configure(Rate.RATE_1000_HZ, LIS331HHRange.RANGE_24G)
 
 
 class H3LIS331(LIS331):
@@ -471,9 +772,9 @@ class H3LIS331(LIS331):
 
     """
 
+    _range_class = H3LIS331Range
+
     def __init__(self, i2c_bus: I2C, address: int = _LIS331_DEFAULT_ADDRESS) -> None:
         # pylint: disable=no-member
         super().__init__(i2c_bus, address)
-        self._range_class = H3LIS331Range
-        self.data_rate = Rate.RATE_1000_HZ
-        self.range = H3LIS331Range.RANGE_400G
+        self._configure(Rate.RATE_1000_HZ, H3LIS331Range.RANGE_400G)
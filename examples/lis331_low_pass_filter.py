@@ -17,6 +17,7 @@ lis.data_rate = Rate.RATE_LOWPOWER_10_HZ
 # next set the cutoff frequency. Anything changing faster than
 # the specified frequency will be filtered out
 lis.lpf_cutoff = Frequency.FREQ_74_HZ
+print(lis.describe())
 
 # Once you've seen the filter do its thing, you can comment out the
 # lines above to use the default data rate without the low pass filter
@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+from adafruit_lis331 import LIS331HH, Rate, SampleRing
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+
+# un-comment the sensor you are using
+# lis = H3LIS331(i2c)
+lis = LIS331HH(i2c)
+
+# take a new sample every 10ms
+lis.data_rate = Rate.RATE_100_HZ
+
+# hold up to 100 samples. If they aren't consumed in time the oldest are overwritten
+ring = SampleRing(100)
+
+while True:
+    # collect samples as the sensor produces them. pump() only adds a sample when there
+    # is a new one, so polling a little faster than the data rate doesn't add repeats
+    for _ in range(100):
+        lis.pump(ring)
+        time.sleep(0.005)
+
+    # then handle everything collected so far in one batch
+    for acceleration in lis.acceleration_stream(ring):
+        print(acceleration)  # plotter friendly printing